@@ -23,22 +23,71 @@ Usage:
   python wise_camt053_transform.py "folder/*.xml" --target 8 --outdir out/ --copy-prtry-to-addtlinf
   python wise_camt053_transform.py input.xml --target 8 --iban CH1234
 
+lxml is used automatically when installed (faster parsing/serialization);
+otherwise the stdlib xml.etree.ElementTree is used.
+
 Optional XSD validation (requires lxml):
   python wise_camt053_transform.py input.xml --target 8 --xsd camt.053.001.08.xsd
 """
 
 from __future__ import annotations
 import argparse
+import functools
 import glob
+import io
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import xml.etree.ElementTree as ET
 import decimal
 
+try:
+    # lxml is a drop-in for the subset of the ElementTree API used here and
+    # parses/serializes at C level; fall back to the stdlib when unavailable.
+    from lxml import etree as ET
+    _HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAVE_LXML = False
+
 XSI_NS = "http://www.w3.org/2001/XMLSchema-instance"
 Decimal = decimal.Decimal
 
+# Local names of elements whose text is run through normalize_datetime().
+DT_LOCALNAMES = {"CreDtTm", "DtTm", "FrDtTm", "ToDtTm"}
+
+# Local names the per-entry helpers look up; see _tags_for().
+_QUALIFIED_TAG_NAMES = (
+    "AddtlNtryInf", "Amt", "AmtDtls", "BkTxCd", "BookgDt", "Cd", "CdtDbtInd",
+    "Domn", "Dt", "DtTm", "Fmly", "Ntry", "Prtry", "Stmt", "SubFmlyCd",
+    "TxDtls", "ValDt",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _xpath_finders(ns: str) -> tuple[ET.XPath, ET.XPath]:
+    """Compiled XPath finders for the entry loop (lxml only).
+
+    etree.XPath compiles the expression once; invoking the compiled object
+    avoids the per-call expression setup that findall(".//...") pays.
+    """
+    nsarg = {"c": ns}
+    return (
+        ET.XPath(".//c:Stmt/c:Ntry", namespaces=nsarg),
+        ET.XPath(".//c:TxDtls", namespaces=nsarg),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _tags_for(ns: str) -> dict[str, str]:
+    """Map local names to namespace-qualified (Clark notation) tags.
+
+    Built once per namespace so the per-entry helpers do dict lookups instead
+    of re-running an f-string format for every entry of the statement.
+    """
+    return {name: f"{{{ns}}}{name}" for name in _QUALIFIED_TAG_NAMES}
+
 _DT_RE = re.compile(
     r"^(\d{4}-\d{2}-\d{2})(?:T(\d{2}:\d{2}:\d{2})(?:\.(\d+))?)?((?:Z)|(?:[+-]\d{2}:\d{2}))?$"
 )
@@ -49,8 +98,13 @@ _CONVERSION_RE = re.compile(
 )
 
 
-def _localname(tag: str) -> str:
-    return tag.split("}", 1)[1] if tag.startswith("{") else tag
+def _localname(tag: str | object) -> str:
+    # lxml trees can contain comments/PIs whose .tag is not a string.
+    if not isinstance(tag, str):
+        return ""
+    # find() == -1 makes the slice start at 0, i.e. the unqualified tag
+    # passes through unchanged. Hot paths inline this expression.
+    return tag[tag.find("}") + 1:]
 
 
 def _get_default_ns(elem: ET.Element) -> str:
@@ -58,10 +112,47 @@ def _get_default_ns(elem: ET.Element) -> str:
     return m.group(1) if m else ""
 
 
+def _is_tz_offset(s: str) -> bool:
+    return (
+        len(s) == 6
+        and s[0] in "+-"
+        and s[1:3].isdigit()
+        and s[3] == ":"
+        and s[4:6].isdigit()
+    )
+
+
 def normalize_datetime(text: str, max_frac: int = 6) -> str:
     if not text:
         return text
     t = text.strip()
+    n = len(t)
+    # Fast path for the fixed-shape ISO-8601 values WISE emits
+    # ("YYYY-MM-DD" or "YYYY-MM-DDThh:mm:ss[.frac][Z|+hh:mm]"); index checks
+    # are much cheaper than the regex and cover nearly every input. Anything
+    # that does not match the expected shape exactly falls through.
+    if n == 10 and t[4] == "-" and t[7] == "-":
+        # A valid date passes through unchanged, and so does a malformed one.
+        return t
+    if (
+        n >= 19
+        and t[4] == "-" and t[7] == "-" and t[10] == "T"
+        and t[13] == ":" and t[16] == ":"
+        and t[:4].isdigit() and t[5:7].isdigit() and t[8:10].isdigit()
+        and t[11:13].isdigit() and t[14:16].isdigit() and t[17:19].isdigit()
+    ):
+        rest = t[19:]
+        if rest == "" or rest == "Z" or _is_tz_offset(rest):
+            return t
+        if rest[0] == ".":
+            i = 1
+            while i < len(rest) and rest[i].isdigit():
+                i += 1
+            frac, tz = rest[1:i], rest[i:]
+            if frac and (tz == "" or tz == "Z" or _is_tz_offset(tz)):
+                if len(frac) <= max_frac:
+                    return t
+                return f"{t[:19]}.{frac[:max_frac]}{tz}"
     m = _DT_RE.match(t)
     if not m:
         return t
@@ -78,6 +169,13 @@ def _date_from_dt_or_dttm(text: str) -> str | None:
     if not text:
         return None
     t = text.strip()
+    # Fast path for the plain booking date, by far the most common shape here.
+    if (
+        len(t) == 10
+        and t[4] == "-" and t[7] == "-"
+        and t[:4].isdigit() and t[5:7].isdigit() and t[8:10].isdigit()
+    ):
+        return t
     m = _DT_RE.match(t)
     if m:
         return m.group(1)
@@ -86,19 +184,60 @@ def _date_from_dt_or_dttm(text: str) -> str | None:
     return None
 
 
-def _retag_namespace(root: ET.Element, old_ns: str, new_ns: str) -> None:
-    for el in root.iter():
-        if el.tag.startswith("{" + old_ns + "}"):
-            el.tag = "{" + new_ns + "}" + _localname(el.tag)
+def _normalize_datetimes_by_tag(root: ET.Element, ns: str) -> int:
+    """Normalize datetime text via targeted iter(tag=...) scans.
+
+    Tag filtering happens inside the iterator (at C level under lxml), so
+    only the handful of datetime elements surface to Python instead of every
+    element of the tree. Must run after the namespace retag.
+    """
+    changed = 0
+    for name in DT_LOCALNAMES:
+        for el in root.iter(f"{{{ns}}}{name}"):
+            if el.text:
+                new_txt = normalize_datetime(el.text, max_frac=6)
+                if new_txt != el.text:
+                    el.text = new_txt
+                    changed += 1
+    return changed
 
 
 def _remove_elements_by_localname(root: ET.Element, name: str) -> int:
+    """Remove every element with the given local name in one traversal.
+
+    With lxml every element knows its parent, so a single C-level iter()
+    pass collects the matches and getparent() removes them afterwards
+    (never during iteration). The stdlib fallback walks with an explicit
+    stack instead, since its elements carry no parent link and building a
+    parent map would mean a second full traversal.
+    """
+    if _HAVE_LXML:
+        matches = [
+            el for el in root.iter()
+            if isinstance(el.tag, str) and el.tag.rpartition("}")[2] == name
+        ]
+        for el in matches:
+            parent = el.getparent()
+            if parent is not None:
+                parent.remove(el)
+        return len(matches)
+
     removed = 0
-    for parent in root.iter():
-        for child in list(parent):
+    stack = [root]
+    while stack:
+        parent = stack.pop()
+        matches = None
+        for child in parent:
             if _localname(child.tag) == name:
+                if matches is None:
+                    matches = []
+                matches.append(child)
+            else:
+                stack.append(child)
+        if matches:
+            for child in matches:
                 parent.remove(child)
-                removed += 1
+            removed += len(matches)
     return removed
 
 
@@ -109,6 +248,13 @@ def _fix_negative_debit_sum(root: ET.Element, ns: str) -> bool:
     txt = el.text.strip()
     if not txt.startswith("-"):
         return False
+    candidate = txt[1:]
+    # Plain monetary values just lose the sign; Decimal stays as a fallback
+    # for exotic notations (exponents, leading zeros/'+', ...) so those are
+    # emitted exactly as Decimal would print them.
+    if re.fullmatch(r"(?:0|[1-9]\d*)(?:\.\d+)?", candidate):
+        el.text = candidate
+        return True
     try:
         el.text = str(abs(Decimal(txt)))
         return True
@@ -130,44 +276,59 @@ TXDTLS_ORDER = [
 ]
 AMTDTLS_ORDER = ["InstdAmt", "TxAmt", "CntrValAmt", "AnncdPstngAmt", "PrtryAmt"]
 
+# Prebuilt local-name -> position maps for _reorder_children.
+NTRY_IDX = {name: i for i, name in enumerate(NTRY_ORDER)}
+TXDTLS_IDX = {name: i for i, name in enumerate(TXDTLS_ORDER)}
+AMTDTLS_IDX = {name: i for i, name in enumerate(AMTDTLS_ORDER)}
+
 
-def _reorder_children(parent: ET.Element, order: list[str]) -> bool:
-    idx_map = {name: i for i, name in enumerate(order)}
+def _reorder_children(parent: ET.Element, idx_map: dict[str, int]) -> bool:
     children = list(parent)
     if not children:
         return False
-    keyed = []
-    for orig_i, ch in enumerate(children):
-        keyed.append((idx_map.get(_localname(ch.tag), 10_000), orig_i, ch))
-    keyed_sorted = sorted(keyed, key=lambda t: (t[0], t[1]))
-    new_children = [ch for _, _, ch in keyed_sorted]
-    if new_children == children:
+
+    def key(ch: ET.Element) -> int:
+        tag = ch.tag
+        if not isinstance(tag, str):
+            return 10_000
+        return idx_map.get(tag[tag.find("}") + 1:], 10_000)  # inlined _localname
+
+    keys = [key(ch) for ch in children]
+    if all(keys[i] <= keys[i + 1] for i in range(len(keys) - 1)):
         return False
-    parent[:] = new_children
+    children.sort(key=key)  # stable: equal keys keep their document order
+    parent[:] = children
     return True
 
 
-def _entry_booking_date(ntry: ET.Element, ns: str) -> str | None:
-    bookg = ntry.find(f"{{{ns}}}BookgDt")
+def _entry_booking_date(
+    ntry: ET.Element, tags: dict[str, str], children: dict[str, ET.Element] | None = None
+) -> str | None:
+    bookg = children.get("BookgDt") if children is not None else ntry.find(tags["BookgDt"])
     if bookg is None:
         return None
-    dt = bookg.find(f"{{{ns}}}Dt")
+    dt = bookg.find(tags["Dt"])
     if dt is not None and dt.text:
         return _date_from_dt_or_dttm(dt.text)
-    dttm = bookg.find(f"{{{ns}}}DtTm")
+    dttm = bookg.find(tags["DtTm"])
     if dttm is not None and dttm.text:
         return _date_from_dt_or_dttm(dttm.text)
     return None
 
 
-def _ensure_valdt_on_entry(ntry: ET.Element, ns: str) -> bool:
-    if ntry.find(f"{{{ns}}}ValDt") is not None:
+def _ensure_valdt_on_entry(
+    ntry: ET.Element, tags: dict[str, str], children: dict[str, ET.Element] | None = None
+) -> bool:
+    if children is not None:
+        if "ValDt" in children:
+            return False
+    elif ntry.find(tags["ValDt"]) is not None:
         return False
-    date = _entry_booking_date(ntry, ns)
+    date = _entry_booking_date(ntry, tags, children)
     if not date:
         return False
-    valdt = ET.Element(f"{{{ns}}}ValDt")
-    dt_el = ET.SubElement(valdt, f"{{{ns}}}Dt")
+    valdt = ET.Element(tags["ValDt"])
+    dt_el = ET.SubElement(valdt, tags["Dt"])
     dt_el.text = date
     inserted = False
     for i, ch in enumerate(list(ntry)):
@@ -177,6 +338,8 @@ def _ensure_valdt_on_entry(ntry: ET.Element, ns: str) -> bool:
             break
     if not inserted:
         ntry.insert(0, valdt)
+    if children is not None:
+        children["ValDt"] = valdt
     return True
 
 
@@ -187,24 +350,39 @@ def _default_bk_tx_cd(cdt_dbt_ind: str | None) -> tuple[str, str, str]:
     return domn, fam, sub
 
 
-def _ensure_bktxcd_structure(parent: ET.Element, ns: str, cdt_dbt_ind: str | None) -> bool:
+@functools.lru_cache(maxsize=None)
+def _domn_template(ns: str, domn: str, fam: str, sub: str) -> bytes:
+    """Serialized <Domn> subtree for the given codes, cached per namespace."""
+    return (
+        f'<Domn xmlns="{ns}"><Cd>{domn}</Cd><Fmly><Cd>{fam}</Cd>'
+        f"<SubFmlyCd>{sub}</SubFmlyCd></Fmly></Domn>"
+    ).encode("utf-8")
+
+
+def _ensure_bktxcd_structure(
+    parent: ET.Element,
+    ns: str,
+    tags: dict[str, str],
+    cdt_dbt_ind: str | None,
+    children: dict[str, ET.Element] | None = None,
+) -> bool:
     changed = False
-    bktxcd = parent.find(f"{{{ns}}}BkTxCd")
+    bktxcd = children.get("BkTxCd") if children is not None else parent.find(tags["BkTxCd"])
     if bktxcd is None:
-        bktxcd = ET.Element(f"{{{ns}}}BkTxCd")
+        bktxcd = ET.Element(tags["BkTxCd"])
         parent.append(bktxcd)
+        if children is not None:
+            children["BkTxCd"] = bktxcd
         changed = True
 
-    domn_el = bktxcd.find(f"{{{ns}}}Domn")
+    domn_el = bktxcd.find(tags["Domn"])
     if domn_el is None:
         domn, fam, sub = _default_bk_tx_cd(cdt_dbt_ind)
-        domn_el = ET.Element(f"{{{ns}}}Domn")
-        cd = ET.SubElement(domn_el, f"{{{ns}}}Cd"); cd.text = domn
-        fmly_el = ET.SubElement(domn_el, f"{{{ns}}}Fmly")
-        fam_cd = ET.SubElement(fmly_el, f"{{{ns}}}Cd"); fam_cd.text = fam
-        sub_cd = ET.SubElement(fmly_el, f"{{{ns}}}SubFmlyCd"); sub_cd.text = sub
+        # Parsing the cached template is cheaper than building the five
+        # elements one SubElement call at a time.
+        domn_el = ET.fromstring(_domn_template(ns, domn, fam, sub))
 
-        prtry = bktxcd.find(f"{{{ns}}}Prtry")
+        prtry = bktxcd.find(tags["Prtry"])
         if prtry is not None:
             bktxcd.remove(prtry)
             bktxcd.insert(0, domn_el)
@@ -215,20 +393,33 @@ def _ensure_bktxcd_structure(parent: ET.Element, ns: str, cdt_dbt_ind: str | Non
     return changed
 
 
-def _get_prtry_cd(ntry: ET.Element, ns: str) -> str | None:
-    el = ntry.find(f"{{{ns}}}BkTxCd/{{{ns}}}Prtry/{{{ns}}}Cd")
+def _get_prtry_cd(
+    ntry: ET.Element, tags: dict[str, str], children: dict[str, ET.Element] | None = None
+) -> str | None:
+    bktxcd = children.get("BkTxCd") if children is not None else ntry.find(tags["BkTxCd"])
+    if bktxcd is None:
+        return None
+    el = bktxcd.find(f"{tags['Prtry']}/{tags['Cd']}")
     return el.text.strip() if el is not None and el.text and el.text.strip() else None
 
 
-def _maybe_copy_prtry_to_addtlinf(ntry: ET.Element, ns: str, *, append_if_present: bool) -> bool:
-    pr_cd = _get_prtry_cd(ntry, ns)
+def _maybe_copy_prtry_to_addtlinf(
+    ntry: ET.Element,
+    tags: dict[str, str],
+    *,
+    append_if_present: bool,
+    children: dict[str, ET.Element] | None = None,
+) -> bool:
+    pr_cd = _get_prtry_cd(ntry, tags, children)
     if not pr_cd:
         return False
-    add = ntry.find(f"{{{ns}}}AddtlNtryInf")
+    add = children.get("AddtlNtryInf") if children is not None else ntry.find(tags["AddtlNtryInf"])
     if add is None:
-        add = ET.Element(f"{{{ns}}}AddtlNtryInf")
+        add = ET.Element(tags["AddtlNtryInf"])
         add.text = pr_cd
         ntry.append(add)
+        if children is not None:
+            children["AddtlNtryInf"] = add
         return True
 
     cur = (add.text or "").strip()
@@ -300,7 +491,7 @@ def _parse_number(num: str) -> Decimal:
     return Decimal(s)
 
 
-def _parse_conversion_text(text: str | None):
+def _parse_conversion_text(text: str | None) -> dict | None:
     if not text:
         return None
     m = _CONVERSION_RE.search(text)
@@ -352,8 +543,8 @@ def _normalized_conversion_ref_from_prtry(prtry_cd: str | None) -> str | None:
     return None
 
 
-def _is_conversion_entry(ntry: ET.Element, ns: str) -> bool:
-    pr = (_get_prtry_cd(ntry, ns) or "").strip().upper()
+def _is_conversion_entry(ntry: ET.Element, tags: dict[str, str]) -> bool:
+    pr = (_get_prtry_cd(ntry, tags) or "").strip().upper()
     # Fee entries are separate booking lines and must not be normalized as the
     # conversion itself. They are only used by _build_conversion_fee_map().
     return (
@@ -368,14 +559,14 @@ def _conversion_order_ref_from_prtry(prtry_cd: str | None) -> str | None:
     return _normalized_conversion_ref_from_prtry(prtry_cd)
 
 
-def _build_conversion_fee_map(root: ET.Element, ns: str) -> dict[tuple[str, str], Decimal]:
+def _build_conversion_fee_map(entries: list[ET.Element], tags: dict[str, str]) -> dict[tuple[str, str], Decimal]:
     fees: dict[tuple[str, str], Decimal] = {}
-    for ntry in root.findall(f".//{{{ns}}}Stmt/{{{ns}}}Ntry"):
-        pr = (_get_prtry_cd(ntry, ns) or "").strip().upper()
+    for ntry in entries:
+        pr = (_get_prtry_cd(ntry, tags) or "").strip().upper()
         if not pr.startswith(_FEE_CONVERSION_PRTRY_PREFIXES):
             continue
         order_ref = _normalized_conversion_ref_from_prtry(pr)
-        amt_el = _find_direct(ntry, ns, "Amt")
+        amt_el = ntry.find(tags["Amt"])
         if order_ref is None or amt_el is None or not amt_el.text:
             continue
         ccy = (amt_el.get("Ccy") or "").upper()
@@ -424,7 +615,8 @@ def _remove_direct(parent: ET.Element | None, ns: str, local_name: str) -> bool:
 
 
 def _normalize_conversion_amtdtls(ntry: ET.Element, ns: str, fee_map: dict[tuple[str, str], Decimal] | None = None) -> bool:
-    if not _is_conversion_entry(ntry, ns):
+    tags = _tags_for(ns)
+    if not _is_conversion_entry(ntry, tags):
         return False
 
     amt_el = _find_direct(ntry, ns, "Amt")
@@ -471,7 +663,7 @@ def _normalize_conversion_amtdtls(ntry: ET.Element, ns: str, fee_map: dict[tuple
 
     addtl = _find_direct(ntry, ns, "AddtlNtryInf")
     parsed = _parse_conversion_text(addtl.text if addtl is not None else None)
-    prtry_cd = _get_prtry_cd(ntry, ns)
+    prtry_cd = _get_prtry_cd(ntry, tags)
     order_ref = _conversion_order_ref_from_prtry(prtry_cd)
 
     changed = False
@@ -579,7 +771,7 @@ def _normalize_conversion_amtdtls(ntry: ET.Element, ns: str, fee_map: dict[tuple
             amtdtls.remove(cntrval)
             changed = True
 
-    if _reorder_children(amtdtls, AMTDTLS_ORDER):
+    if _reorder_children(amtdtls, AMTDTLS_IDX):
         changed = True
     return changed
 
@@ -613,14 +805,114 @@ def _set_stmt_account_iban(root: ET.Element, ns: str, iban: str) -> int:
         changed += 1
     return changed
 
-def _validate_with_xsd(xml_path: Path, xsd_path: Path) -> tuple[bool, list[str]]:
+def _serialize_output(tree: ET.ElementTree, old_ns: str, new_ns: str) -> bytes:
+    """Serialize the tree and swap the namespace URI at byte level.
+
+    transform_tree() leaves the tree in the input namespace; the version
+    change is a pure URI substitution (camt.053.001.10 -> .08/.04), so one
+    C-level bytes.replace on the serialized document replaces the former
+    O(elements) retag walk plus the root rebuild lxml needed for it. The URN
+    cannot occur in camt.053 text content, and the xsi:schemaLocation
+    attribute that also carries it is removed before serialization.
+    """
+    if _HAVE_LXML:
+        data = ET.tostring(tree, encoding="utf-8", xml_declaration=True)
+    else:
+        data = ET.tostring(tree.getroot(), encoding="utf-8", xml_declaration=True)
+    if old_ns != new_ns:
+        data = data.replace(old_ns.encode("utf-8"), new_ns.encode("utf-8"))
+    return data
+
+
+class _NamespaceRewritingSink:
+    """File-like sink replacing the namespace URI while bytes stream through.
+
+    Holds back the last len(old)-1 bytes between writes so a URI split
+    across chunk boundaries is still replaced; close() flushes the carry.
+    """
+
+    def __init__(self, fh, old: bytes, new: bytes) -> None:
+        self._fh = fh
+        self._old = old
+        self._new = new
+        self._keep = len(old) - 1
+        self._carry = b""
+
+    def write(self, data: bytes) -> int:
+        # Replace across the full carry+chunk window; the retained tail is
+        # shorter than the old URI, so a match can never hide entirely in it
+        # (re-replacing already rewritten carry bytes is a no-op because the
+        # new URI does not contain the old one).
+        buf = (self._carry + data).replace(self._old, self._new)
+        if len(buf) > self._keep:
+            self._carry = buf[len(buf) - self._keep:]
+            self._fh.write(buf[:len(buf) - self._keep])
+        else:
+            self._carry = buf
+        return len(data)
+
+    def flush(self) -> None:
+        # Intentionally does not flush the carry: a URI could still be
+        # completed by the next write.
+        self._fh.flush()
+
+    def close(self) -> None:
+        if self._carry:
+            self._fh.write(self._carry)
+            self._carry = b""
+
+
+def _write_output(tree: ET.ElementTree, outfile: Path, old_ns: str, new_ns: str) -> None:
+    """Write the transformed tree to outfile.
+
+    The lxml path streams through etree.xmlfile and rewrites the namespace
+    on the fly, so no full serialized copy of the document is held in
+    memory; the stdlib fallback serializes via _serialize_output().
+    """
+    if not _HAVE_LXML:
+        outfile.write_bytes(_serialize_output(tree, old_ns, new_ns))
+        return
+    with open(outfile, "wb") as fh:
+        sink = fh
+        if old_ns != new_ns:
+            sink = _NamespaceRewritingSink(fh, old_ns.encode("utf-8"), new_ns.encode("utf-8"))
+        with ET.xmlfile(sink, encoding="utf-8") as xf:
+            xf.write_declaration()
+            xf.write(tree.getroot())
+        if sink is not fh:
+            sink.close()
+
+
+# Compiled lxml XMLSchema objects, keyed by XSD path. Schema compilation
+# dominates validation cost for small files, so it runs once per process.
+_SCHEMA_CACHE: dict[str, object] = {}
+
+
+def _load_schema(xsd_path: Path) -> "LET.XMLSchema":
+    import lxml.etree as LET
+    key = str(xsd_path)
+    schema = _SCHEMA_CACHE.get(key)
+    if schema is None:
+        schema = LET.XMLSchema(LET.parse(key))
+        _SCHEMA_CACHE[key] = schema
+    return schema
+
+
+def _validate_with_xsd(doc: bytes | str | Path, xsd_path: Path) -> tuple[bool, list[str]]:
+    """Validate doc against the XSD.
+
+    doc is either the serialized output bytes (validated in memory, no disk
+    round-trip) or a path to an XML file, which is parsed first.
+    """
     try:
         import lxml.etree as LET
     except Exception:
         return False, ["lxml is not installed; cannot validate with XSD. Install lxml or omit --xsd."]
-    schema_doc = LET.parse(str(xsd_path))
-    schema = LET.XMLSchema(schema_doc)
-    doc = LET.parse(str(xml_path))
+    schema = _load_schema(xsd_path)
+    if isinstance(doc, bytes):
+        doc = LET.fromstring(doc)
+    elif isinstance(doc, (str, Path)):
+        doc = LET.parse(str(doc))
     ok = schema.validate(doc)
     errs = []
     if not ok:
@@ -629,7 +921,13 @@ def _validate_with_xsd(xml_path: Path, xsd_path: Path) -> tuple[bool, list[str]]
     return ok, errs
 
 
-def transform_tree(tree: ET.ElementTree, target_version: int, *, copy_prtry_to_addtlinf: bool, append_if_present: bool, iban: str | None = None) -> dict:
+def transform_tree(tree: ET.ElementTree, target_version: int, *, copy_prtry_to_addtlinf: bool, append_if_present: bool, iban: str | None = None, prenormalized: dict | None = None) -> dict:
+    """Apply all bexio fixes to the tree and return the change report.
+
+    The tree is mutated in the *input* namespace; the version change itself
+    happens as a URI substitution in _serialize_output(), so write the result
+    with that instead of tree.write().
+    """
     if target_version not in (4, 8):
         raise ValueError("target_version must be 4 or 8")
     if iban is not None:
@@ -642,26 +940,26 @@ def transform_tree(tree: ET.ElementTree, target_version: int, *, copy_prtry_to_a
         raise ValueError(f"Input does not look like camt.053.* (root namespace: {old_ns})")
 
     new_ns = f"urn:iso:std:iso:20022:tech:xsd:camt.053.001.{target_version:02d}"
-    ET.register_namespace("", new_ns)
-    ET.register_namespace("xsi", XSI_NS)
-
-    _retag_namespace(root, old_ns, new_ns)
+    if not _HAVE_LXML:
+        ET.register_namespace("", old_ns)
+        ET.register_namespace("xsi", XSI_NS)
+
+    if prenormalized is not None:
+        # _parse_input() already normalized datetimes and removed AdrTp while
+        # building the tree; only the counts remain.
+        dt_changed = prenormalized["timestamps_normalized"]
+        adr_tp_removed = prenormalized["AdrTp_removed"]
+    else:
+        dt_changed = _normalize_datetimes_by_tag(root, old_ns)
+        # Stays localname-based on purpose: AdrTp removal is documented as
+        # broad, regardless of the namespace an element ended up in.
+        adr_tp_removed = _remove_elements_by_localname(root, "AdrTp")
 
     schema_loc_attr = "{" + XSI_NS + "}schemaLocation"
     if schema_loc_attr in root.attrib:
         root.attrib.pop(schema_loc_attr, None)
-
-    dt_changed = 0
-    for el in root.iter():
-        if _localname(el.tag) in {"CreDtTm", "DtTm", "FrDtTm", "ToDtTm"} and el.text:
-            new_txt = normalize_datetime(el.text, max_frac=6)
-            if new_txt != el.text:
-                el.text = new_txt
-                dt_changed += 1
-
-    adr_tp_removed = _remove_elements_by_localname(root, "AdrTp")
-    debit_sum_fixed = _fix_negative_debit_sum(root, new_ns)
-    stmt_iban_set = _set_stmt_account_iban(root, new_ns, iban) if iban else 0
+    debit_sum_fixed = _fix_negative_debit_sum(root, old_ns)
+    stmt_iban_set = _set_stmt_account_iban(root, old_ns, iban) if iban else 0
 
     valdt_added = 0
     bktxcd_fixed = 0
@@ -671,38 +969,77 @@ def transform_tree(tree: ET.ElementTree, target_version: int, *, copy_prtry_to_a
     reordered_amtdtls = 0
     addtl_changed = 0
     conversion_fixed = 0
-    fee_map = _build_conversion_fee_map(root, new_ns)
+    tags = _tags_for(old_ns)
+    if _HAVE_LXML:
+        stmt_ntry_finder, tx_dtls_finder = _xpath_finders(old_ns)
+        entries = stmt_ntry_finder(root)
+    else:
+        tx_dtls_finder = None
+        entries = root.findall(f".//{tags['Stmt']}/{tags['Ntry']}")
+    fee_map = _build_conversion_fee_map(entries, tags)
+
+    for ntry in entries:
+        # One scan over the direct children serves two purposes: it detects
+        # entries where every helper below is a no-op (files that went through
+        # the transformer once, or WISE exports that are already compliant)
+        # so they can be skipped entirely, and for the rest it is handed to
+        # the helpers so none of them re-runs find() for the same children.
+        seen: dict[str, ET.Element] = {}
+        in_order = True
+        prev_key = -1
+        for ch in ntry:
+            ln = _localname(ch.tag)
+            if ln not in seen:
+                seen[ln] = ch
+            k = NTRY_IDX.get(ln, 10_000)
+            if k < prev_key:
+                in_order = False
+            prev_key = k
+        bktxcd = seen.get("BkTxCd")
+        if (
+            in_order
+            and "ValDt" in seen
+            and "AmtDtls" not in seen
+            # TxDtls only occurs under NtryDtls in camt.053.
+            and "NtryDtls" not in seen
+            and bktxcd is not None
+            and bktxcd.find(tags["Domn"]) is not None
+            and (not copy_prtry_to_addtlinf or _get_prtry_cd(ntry, tags, seen) is None)
+        ):
+            continue
 
-    for ntry in root.findall(f".//{{{new_ns}}}Stmt/{{{new_ns}}}Ntry"):
-        cdi_el = ntry.find(f"{{{new_ns}}}CdtDbtInd")
+        cdi_el = seen.get("CdtDbtInd")
         cdi = cdi_el.text.strip() if cdi_el is not None and cdi_el.text else None
 
-        if _ensure_valdt_on_entry(ntry, new_ns):
+        if _ensure_valdt_on_entry(ntry, tags, seen):
             valdt_added += 1
-        if _ensure_bktxcd_structure(ntry, new_ns, cdi):
+        if _ensure_bktxcd_structure(ntry, old_ns, tags, cdi, seen):
             bktxcd_fixed += 1
 
-        if _normalize_conversion_amtdtls(ntry, new_ns, fee_map=fee_map):
+        # Never creates or removes the entry's AmtDtls (it bails out when
+        # missing), so the scanned element stays valid.
+        if _normalize_conversion_amtdtls(ntry, old_ns, fee_map=fee_map):
             conversion_fixed += 1
 
         if copy_prtry_to_addtlinf:
-            if _maybe_copy_prtry_to_addtlinf(ntry, new_ns, append_if_present=append_if_present):
+            if _maybe_copy_prtry_to_addtlinf(ntry, tags, append_if_present=append_if_present, children=seen):
                 addtl_changed += 1
 
-        amt_parent = ntry.find(f"{{{new_ns}}}AmtDtls")
-        if amt_parent is not None and _reorder_children(amt_parent, AMTDTLS_ORDER):
+        amt_parent = seen.get("AmtDtls")
+        if amt_parent is not None and _reorder_children(amt_parent, AMTDTLS_IDX):
             reordered_amtdtls += 1
 
-        if _reorder_children(ntry, NTRY_ORDER):
+        if _reorder_children(ntry, NTRY_IDX):
             reordered_ntry += 1
 
-        for txdtls in ntry.findall(f".//{{{new_ns}}}TxDtls"):
-            if _ensure_bktxcd_structure(txdtls, new_ns, cdi):
+        tx_dtls_list = tx_dtls_finder(ntry) if tx_dtls_finder is not None else ntry.findall(f".//{tags['TxDtls']}")
+        for txdtls in tx_dtls_list:
+            if _ensure_bktxcd_structure(txdtls, old_ns, tags, cdi):
                 tx_bktxcd_fixed += 1
-            amt_parent = txdtls.find(f"{{{new_ns}}}AmtDtls")
-            if amt_parent is not None and _reorder_children(amt_parent, AMTDTLS_ORDER):
+            amt_parent = txdtls.find(tags["AmtDtls"])
+            if amt_parent is not None and _reorder_children(amt_parent, AMTDTLS_IDX):
                 reordered_amtdtls += 1
-            if _reorder_children(txdtls, TXDTLS_ORDER):
+            if _reorder_children(txdtls, TXDTLS_IDX):
                 reordered_txdtls += 1
 
     return {
@@ -723,6 +1060,46 @@ def transform_tree(tree: ET.ElementTree, target_version: int, *, copy_prtry_to_a
     }
 
 
+def _parse_input(infile: Path) -> tuple[ET.ElementTree, dict | None]:
+    """Parse infile; on the lxml path, normalize while the tree is built.
+
+    iterparse fires one end event per element, so the datetime normalization
+    and AdrTp removal ride along with parsing instead of re-walking the
+    finished tree afterwards. The applied counts are returned so
+    transform_tree() can skip those passes (and report them unchanged).
+
+    The file is slurped with a single read_bytes() and parsed from memory:
+    one sequential read instead of the parser's many small ones, which adds
+    up across a glob of inputs on network filesystems.
+    """
+    data = infile.read_bytes()
+    if not _HAVE_LXML:
+        return ET.parse(io.BytesIO(data)), None
+    dt_changed = 0
+    adr_tp: list[ET.Element] = []
+    context = ET.iterparse(io.BytesIO(data), events=("end",), huge_tree=True)
+    for _event, el in context:
+        tag = el.tag
+        ln = tag[tag.find("}") + 1:]  # inlined _localname
+        if ln in DT_LOCALNAMES:
+            if el.text:
+                new_txt = normalize_datetime(el.text, max_frac=6)
+                if new_txt != el.text:
+                    el.text = new_txt
+                    dt_changed += 1
+        elif ln == "AdrTp":
+            adr_tp.append(el)
+    # Deferred: removing elements while iterparse still builds their parents
+    # is not safe.
+    for el in adr_tp:
+        el.getparent().remove(el)
+    tree = context.root.getroottree()
+    return tree, {
+        "timestamps_normalized": dt_changed,
+        "AdrTp_removed": len(adr_tp),
+    }
+
+
 def _default_outfile(infile: Path, target_version: int) -> Path:
     return infile.with_name(infile.stem + f"_camt053_v{target_version:02d}_bexio.xml")
 
@@ -764,39 +1141,83 @@ def main(argv: list[str]) -> int:
         print(f"XSD not found: {xsd_path}", file=sys.stderr)
         return 2
 
+    worker = functools.partial(_process_one, args=args, outdir=outdir, xsd_path=xsd_path)
+    if len(input_files) == 1:
+        results = [worker(input_files[0])]
+    else:
+        # Files are independent of each other, so batch conversions spread
+        # across cores; ex.map keeps the printed results in input order.
+        max_workers = min(len(input_files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(xsd_path,),
+        ) as ex:
+            results = list(ex.map(worker, input_files))
+
     ok_count = 0
-    for infile in input_files:
-        try:
-            tree = ET.parse(infile)
-            report = transform_tree(
-                tree, args.target,
-                copy_prtry_to_addtlinf=args.copy_prtry_to_addtlinf,
-                append_if_present=args.append_prtry,
-                iban=args.iban,
-            )
-            outfile = Path(args.out) if args.out else _default_outfile(infile, args.target)
-            if outdir and not args.out:
-                outfile = outdir / outfile.name
-            tree.write(outfile, encoding="utf-8", xml_declaration=True)
-
-            valid_txt = ""
-            if xsd_path:
-                ok, errs = _validate_with_xsd(outfile, xsd_path)
-                valid_txt = " | XSD:OK" if ok else (" | XSD:FAIL " + ("; ".join(errs[:3]) if errs else ""))
-
-            print(
-                f"[OK] {infile.name} -> {outfile.name}{valid_txt} | "
-                f"ConvFix={report['conversion_amtdtls_fixed']}, "
-                f"StmtIBAN={report['stmt_account_iban_set']}, "
-                f"AddtlNtryInf*={report['addtl_ntryinf_changed']}, "
-                f"ValDt+={report['valdt_added_on_entries']}"
-            )
+    for ok, msg in results:
+        if ok:
+            print(msg)
             ok_count += 1
-        except Exception as e:
-            print(f"[FAIL] {infile}: {e}", file=sys.stderr)
+        else:
+            print(msg, file=sys.stderr)
 
     return 0 if ok_count == len(input_files) else 1
 
 
+def _init_worker(xsd_path: Path | None) -> None:
+    """Pool initializer: compile the schema once per worker, not per file."""
+    if xsd_path is None:
+        return
+    try:
+        _load_schema(xsd_path)
+    except Exception:
+        # A failing initializer would kill the pool; let the per-file
+        # validation path report the problem instead.
+        pass
+
+
+def _process_one(infile: Path, args: argparse.Namespace, outdir: Path | None, xsd_path: Path | None) -> tuple[bool, str]:
+    """Convert one input file; returns (ok, console message).
+
+    Runs in a worker process for batch conversions, so it must not print
+    itself: output order is kept deterministic by the parent.
+    """
+    try:
+        tree, pre = _parse_input(infile)
+        report = transform_tree(
+            tree, args.target,
+            copy_prtry_to_addtlinf=args.copy_prtry_to_addtlinf,
+            append_if_present=args.append_prtry,
+            iban=args.iban,
+            prenormalized=pre,
+        )
+        outfile = Path(args.out) if args.out else _default_outfile(infile, args.target)
+        if outdir and not args.out:
+            outfile = outdir / outfile.name
+        valid_txt = ""
+        if xsd_path:
+            # Validation needs the finished document in memory anyway, so
+            # serialize to bytes, write those and validate the same bytes
+            # without re-reading the file from disk.
+            out_bytes = _serialize_output(tree, report["old_ns"], report["new_ns"])
+            outfile.write_bytes(out_bytes)
+            ok, errs = _validate_with_xsd(out_bytes, xsd_path)
+            valid_txt = " | XSD:OK" if ok else (" | XSD:FAIL " + ("; ".join(errs[:3]) if errs else ""))
+        else:
+            _write_output(tree, outfile, report["old_ns"], report["new_ns"])
+
+        return True, (
+            f"[OK] {infile.name} -> {outfile.name}{valid_txt} | "
+            f"ConvFix={report['conversion_amtdtls_fixed']}, "
+            f"StmtIBAN={report['stmt_account_iban_set']}, "
+            f"AddtlNtryInf*={report['addtl_ntryinf_changed']}, "
+            f"ValDt+={report['valdt_added_on_entries']}"
+        )
+    except Exception as e:
+        return False, f"[FAIL] {infile}: {e}"
+
+
 if __name__ == "__main__":
     raise SystemExit(main(sys.argv[1:]))